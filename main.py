@@ -2,6 +2,7 @@ import os
 import sys
 import argparse
 from src.agent import SlowAgent
+from src.interactive import InteractiveSession
 from src.utils.logger import Logger
 from src.utils.config import Config
 
@@ -55,19 +56,7 @@ def main():
         agent.run_session(tasks=tasks)
     elif args.interactive:
         logger.info("Running agent in interactive mode")
-        try:
-            print(f"Slow Agent Interactive Mode - Type 'exit' to quit")
-            while True:
-                user_input = input("\nEnter task: ")
-                if user_input.lower() in ["exit", "quit"]:
-                    break
-                
-                if user_input.strip():
-                    # Execute task directly in interactive mode
-                    agent.add_task(user_input)
-                    agent.execute_next_task()
-        except KeyboardInterrupt:
-            print("\nInteractive mode terminated by user")
+        InteractiveSession(agent).run()
     else:
         logger.info("No tasks provided. Use --task, --task-file, or --interactive")
         print("No tasks provided. Use --task, --task-file, or --interactive")
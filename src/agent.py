@@ -1,11 +1,15 @@
 import time
 import random
+import threading
 from .utils.logger import Logger
 from .utils.llm_client import LLMClient
 from .utils.config import Config
 from .actions.browser import BrowserHandler
 from .actions.desktop import DesktopHandler
 
+class TaskCancelled(Exception):
+    """Raised when the task currently being executed is cancelled."""
+
 class SlowAgent:
     """A slow, deliberate agent for interacting with various interfaces."""
     
@@ -26,15 +30,53 @@ class SlowAgent:
         self.current_task = None
         self.last_action_time = 0
         self.thinking = False
+        self.cancel_event = threading.Event()
+        self.progress_callback = None
+    
+    def _report_progress(self, stage):
+        """Pass the current stage of work to the progress callback, if one is set."""
+        if self.progress_callback:
+            self.progress_callback(stage)
+    
+    def cancel_current_task(self):
+        """Request cancellation of the task currently being executed.
+
+        The task stops at its next pause; an LLM call already in flight is
+        allowed to return first.
+        """
+        self.logger.info(f"Cancelling task: {self.current_task}")
+        self.cancel_event.set()
+    
+    def reset_cancel(self):
+        """Clear any pending cancellation before starting a new task."""
+        self.cancel_event.clear()
+    
+    def _check_cancelled(self, history_length):
+        """Raise TaskCancelled if cancellation has been requested.
+
+        On cancellation the conversation history is truncated back to
+        history_length so later tasks are not conditioned on the cancelled one.
+        """
+        if self.cancel_event.is_set():
+            del self.conversation_history[history_length:]
+            self.thinking = False
+            raise TaskCancelled(self.current_task)
+    
+    def _pause(self, seconds, history_length):
+        """Sleep for the given time, stopping early if cancellation is requested."""
+        self.cancel_event.wait(seconds)
+        self._check_cancelled(history_length)
     
     def think(self, prompt, system_message=None):
         """Think about the given prompt - this is the main reasoning function."""
         self.thinking = True
+        history_length = len(self.conversation_history)
         self.logger.info(f"Thinking about: {prompt[:50]}..." if len(prompt) > 50 else f"Thinking about: {prompt}")
         
         # Add pauses to simulate deep thinking
+        self._report_progress("thinking")
         thinking_duration = random.uniform(1.0, 3.0)
-        time.sleep(thinking_duration)
+        self._pause(thinking_duration, history_length)
         
         # Default system message if none provided
         if system_message is None:
@@ -50,13 +92,18 @@ class SlowAgent:
         self.conversation_history.append({"role": "user", "content": prompt})
         
         # Generate response
+        self._report_progress("waiting for LLM response")
         response = self.llm.generate_with_history(self.conversation_history)
         
+        # The LLM call cannot be interrupted, so honour a cancel made while waiting on it
+        self._check_cancelled(history_length)
+        
         # Add response to history
         self.conversation_history.append({"role": "assistant", "content": response})
         
         # Add another pause after thinking
-        time.sleep(random.uniform(0.5, 1.5))
+        self._report_progress("reviewing response")
+        self._pause(random.uniform(0.5, 1.5), history_length)
         self.thinking = False
         
         return response
@@ -0,0 +1,305 @@
+import asyncio
+import itertools
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .agent import TaskCancelled
+from .utils.logger import Logger
+
+HELP_TEXT = (
+    "Commands:\n"
+    "  <task>        queue a task to run in the background\n"
+    "  status        show running task, queue depth and latency stats\n"
+    "  cancel [id]   cancel a queued task, or the running (else next queued) one if no id is given;\n"
+    "                a running task stops once its current LLM call returns\n"
+    "  help          show this message\n"
+    "  exit / quit   cancel outstanding work and leave"
+)
+
+# Only these exact lines are commands; anything else is queued as a task
+CANCEL_PATTERN = re.compile(r"cancel(?:\s+#?(\d+))?", re.IGNORECASE)
+
+class InteractiveJob:
+    """A task submitted from the interactive prompt."""
+
+    def __init__(self, job_id, description):
+        """Initialize the job."""
+        self.id = job_id
+        self.description = description
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.stage = None
+        self.cancel_requested = False
+
+class InteractiveSession:
+    """Asyncio-driven interactive mode that runs tasks in the background."""
+
+    def __init__(self, agent):
+        """Initialize the interactive session."""
+        self.agent = agent
+        self.logger = Logger(name="interactive")
+
+        # The agent keeps shared conversation state, so tasks run one at a time
+        # on a dedicated worker thread while the prompt stays responsive.
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent")
+        self.ids = itertools.count(1)
+        self.queue = None
+        self.pending = {}
+        self.running = None
+        self.reading = False
+
+        # Stats
+        self.completed = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.wait_times = []
+        self.run_times = []
+
+    def run(self):
+        """Run the interactive session until the user exits."""
+        try:
+            asyncio.run(self._main())
+        except KeyboardInterrupt:
+            print("\nInteractive mode terminated by user")
+        finally:
+            self.executor.shutdown(wait=True)
+
+    async def _main(self):
+        """Read commands from the prompt while the worker drains the queue."""
+        loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        lines = asyncio.Queue()
+        worker = asyncio.create_task(self._worker())
+        self._start_reader(loop, lines)
+
+        # Progress is reported from the agent thread; hop back onto the loop
+        self.agent.progress_callback = lambda stage: loop.call_soon_threadsafe(self._on_progress, stage)
+
+        # Keep INFO chatter out of the prompt; it still goes to the log files
+        quiet_loggers = [self.logger, self.agent.logger, self.agent.llm.logger]
+        for handler in [self.agent.browser, self.agent.desktop]:
+            if handler:
+                quiet_loggers.append(handler.logger)
+        console_levels = [(logger, logger.set_console_level(logging.WARNING)) for logger in quiet_loggers]
+
+        print("Slow Agent Interactive Mode - Type 'help' for commands, 'exit' to quit")
+        self.reading = True
+        self._show_prompt()
+        try:
+            while True:
+                user_input = await lines.get()
+                if user_input is None:
+                    # End of input (e.g. piped tasks): let queued work finish
+                    self.reading = False
+                    break
+                if not self._handle_command(user_input.strip()):
+                    self.reading = False
+                    self._cancel_all()
+                    break
+                self._show_prompt()
+
+            await self.queue.join()
+        finally:
+            self.agent.progress_callback = None
+            worker.cancel()
+            for logger, level in console_levels:
+                logger.set_console_level(level)
+
+    def _start_reader(self, loop, lines):
+        """Read stdin on a daemon thread so a pending input() never blocks shutdown."""
+        def read():
+            while True:
+                try:
+                    line = input()
+                except (EOFError, ValueError):
+                    line = None
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+                if line is None or line.strip().lower() in ["exit", "quit"]:
+                    break
+
+        threading.Thread(target=read, name="stdin-reader", daemon=True).start()
+
+    def _show_prompt(self):
+        """Print the input prompt, unless input has ended."""
+        if self.reading:
+            print("\nEnter task: ", end="", flush=True)
+
+    def _notify(self, message):
+        """Print a background update and redraw the prompt below it."""
+        print(f"\n{message}")
+        self._show_prompt()
+
+    def _handle_command(self, command):
+        """Dispatch a line of user input. Returns False when the session should end."""
+        if not command:
+            return True
+
+        keyword = command.lower()
+        cancel_match = CANCEL_PATTERN.fullmatch(command)
+
+        if keyword in ["exit", "quit"]:
+            return False
+        elif keyword == "help":
+            print(HELP_TEXT)
+        elif keyword in ["status", "stats"]:
+            print(self.format_status())
+        elif cancel_match:
+            job_id = cancel_match.group(1)
+            self.cancel(int(job_id) if job_id else None)
+        else:
+            self.submit(command)
+
+        return True
+
+    def submit(self, description):
+        """Queue a task for background execution."""
+        job = InteractiveJob(next(self.ids), description)
+        self.pending[job.id] = job
+        self.queue.put_nowait(job)
+        self.logger.info(f"Queued task #{job.id}: {description}")
+        print(f"[#{job.id}] queued (queue depth: {len(self.pending)})")
+        return job
+
+    def cancel(self, job_id=None):
+        """Cancel a queued task by id, or the running task if no id is given.
+
+        With no id and nothing running yet, the next queued task is cancelled,
+        so a cancel typed right after submitting still hits that task. A running
+        task stops at its next pause, after any in-flight LLM call returns.
+        """
+        if job_id is None:
+            job = self.running
+            if job is None or job.cancel_requested:
+                job = next(iter(self.pending.values()), None)
+        else:
+            job = self.pending.get(job_id)
+            if job is None and self.running and self.running.id == job_id:
+                job = self.running
+
+        if job is None:
+            print("No matching task to cancel")
+            return False
+
+        if job.cancel_requested:
+            print(f"[#{job.id}] already cancelling")
+            return False
+
+        job.cancel_requested = True
+        if job is self.running:
+            self.agent.cancel_current_task()
+            print(f"[#{job.id}] cancelling...")
+        else:
+            # Leave it in the queue; the worker skips it when it comes up
+            del self.pending[job.id]
+            self._record_cancelled(job)
+            print(f"[#{job.id}] cancelled")
+        return True
+
+    def _cancel_all(self):
+        """Cancel every queued task and the running one."""
+        for job_id in list(self.pending):
+            self.cancel(job_id)
+        if self.running and not self.running.cancel_requested:
+            self.cancel(self.running.id)
+
+    async def _worker(self):
+        """Execute queued tasks one at a time on the agent thread."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            job = await self.queue.get()
+            try:
+                if job.cancel_requested:
+                    continue
+
+                del self.pending[job.id]
+                self.running = job
+                job.started_at = time.monotonic()
+                self.wait_times.append(job.started_at - job.submitted_at)
+                self._notify(f"[#{job.id}] started: {job.description}")
+
+                # Reset on this thread, before handing off, so a cancel issued
+                # while the executor spins up is not wiped out
+                self.agent.reset_cancel()
+                try:
+                    plan = await loop.run_in_executor(self.executor, self._execute, job.description)
+                except asyncio.CancelledError:
+                    # Session torn down mid-task (e.g. Ctrl-C): stop the agent so
+                    # executor shutdown does not wait out the remaining pauses
+                    self.agent.cancel_current_task()
+                    raise
+                except TaskCancelled:
+                    plan = None
+                except Exception as e:
+                    self.failed += 1
+                    self.logger.error(f"Task #{job.id} failed: {str(e)}")
+                    self._notify(f"[#{job.id}] failed: {str(e)}")
+                    continue
+                finally:
+                    job.finished_at = time.monotonic()
+                    self.running = None
+
+                if plan is None:
+                    self._record_cancelled(job)
+                    self._notify(f"[#{job.id}] cancelled")
+                    continue
+
+                # A cancel that lands after the agent finished is too late: the
+                # plan is already in the conversation history, so report it
+                if job.cancel_requested:
+                    self.logger.info(f"Cancel for task #{job.id} arrived after it finished")
+
+                self.completed += 1
+                self.run_times.append(job.finished_at - job.started_at)
+                self._notify(f"[#{job.id}] completed in {job.finished_at - job.started_at:.1f}s:\n{plan}")
+            finally:
+                self.queue.task_done()
+
+    def _on_progress(self, stage):
+        """Stream a progress update for the running task."""
+        if self.running:
+            self.running.stage = stage
+            self._notify(f"[#{self.running.id}] {stage}...")
+
+    def _execute(self, description):
+        """Run a single task on the agent. Called on the worker thread."""
+        self.agent.add_task(description)
+        return self.agent.execute_next_task()
+
+    def _record_cancelled(self, job):
+        """Count and log a cancelled task."""
+        self.cancelled += 1
+        self.logger.info(f"Cancelled task #{job.id}: {job.description}")
+
+    def format_status(self):
+        """Format the running task, queue depth and latency stats."""
+        lines = []
+        if self.running:
+            elapsed = time.monotonic() - self.running.started_at
+            stage = f", {self.running.stage}" if self.running.stage else ""
+            lines.append(f"Running: [#{self.running.id}] {self.running.description} ({elapsed:.1f}s{stage})")
+        else:
+            lines.append("Running: idle")
+
+        lines.append(f"Queue depth: {len(self.pending)}")
+        for job in self.pending.values():
+            lines.append(f"  [#{job.id}] {job.description}")
+
+        lines.append(f"Completed: {self.completed}  Cancelled: {self.cancelled}  Failed: {self.failed}")
+        lines.append(f"Queue wait: {self._format_latency(self.wait_times)}")
+        lines.append(f"Run time:   {self._format_latency(self.run_times)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_latency(samples):
+        """Summarize a list of latencies in seconds."""
+        if not samples:
+            return "n/a"
+
+        ordered = sorted(samples)
+        mean = sum(ordered) / len(ordered)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return f"last {samples[-1]:.1f}s, mean {mean:.1f}s, p95 {p95:.1f}s, max {ordered[-1]:.1f}s"
@@ -35,6 +35,13 @@ class Logger:
         # Add handlers to the logger
         self.logger.addHandler(console_handler)
         self.logger.addHandler(file_handler)
+        self.console_handler = console_handler
+    
+    def set_console_level(self, log_level):
+        """Set the console log level, leaving file logging unchanged. Returns the previous level."""
+        previous_level = self.console_handler.level
+        self.console_handler.setLevel(log_level)
+        return previous_level
     
     def info(self, message):
         """Log info message."""